@@ -0,0 +1,42 @@
+# ================================================
+# COLUMN DTYPES
+# Shared by dashboard.py, dashboard_deploy.py and convert_to_parquet.py
+# ================================================
+
+import numpy as np
+
+# Low-cardinality text columns as 'category' (integer codes make groupby
+# and == comparisons much cheaper) and small counts/prices downcast to
+# halve the bytes scanned by every aggregation.
+# total_revenue stays float64: it is summed into the millions, where
+# float32 can no longer represent cents.
+COLUMN_DTYPES = {
+    'Booking_ID': 'string',
+    'booking_status': 'category',
+    'market_segment_type': 'category',
+    'room_type_reserved': 'category',
+    'no_of_adults': 'int8',
+    'no_of_children': 'int8',
+    'lead_time': 'int16',
+    'arrival_year': 'int16',
+    'arrival_month': 'int8',
+    'avg_price_per_room': 'float32'
+}
+
+
+def apply_column_dtypes(df):
+    """
+    Cast df to COLUMN_DTYPES.
+    Integer columns are range-checked first: astype('int8') silently wraps
+    out-of-range values (300 becomes 44) instead of raising.
+    """
+    for col, dtype in COLUMN_DTYPES.items():
+        if dtype.startswith('int'):
+            limits = np.iinfo(dtype)
+            values = df[col].astype('int64')
+            if values.min() < limits.min or values.max() > limits.max:
+                raise ValueError(
+                    f"{col} has values outside the {dtype} range "
+                    f"[{limits.min}, {limits.max}]: min={values.min()}, max={values.max()}"
+                )
+    return df.astype(COLUMN_DTYPES)
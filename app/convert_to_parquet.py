@@ -0,0 +1,24 @@
+# ================================================
+# CONVERT CLEANED CSV TO PARQUET
+# Author: Luiz Milaré
+# Run once after re-exporting hotel_reservations_clean.csv:
+#     cd app && python convert_to_parquet.py
+# ================================================
+
+import os
+import pandas as pd
+from column_dtypes import apply_column_dtypes
+
+# Get the directory where this script is located
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+csv_path = os.path.join(script_dir, 'hotel_reservations_clean.csv')
+parquet_path = os.path.join(script_dir, 'hotel_reservations_clean.parquet')
+
+# Read with default (wide) dtypes, then range-check and store the same
+# dtypes the dashboard works with (see column_dtypes.py)
+df = apply_column_dtypes(pd.read_csv(csv_path))
+
+df.to_parquet(parquet_path, compression='zstd', index=False)
+
+print(f"✅ Wrote {len(df):,} rows to {parquet_path}")
@@ -6,9 +6,12 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from sqlalchemy import create_engine
+from types import SimpleNamespace
+from column_dtypes import apply_column_dtypes
 
 # ================================================
 # PAGE CONFIGURATION
@@ -37,11 +40,10 @@ def get_database_connection():
 # LOAD DATA FROM MYSQL
 # ================================================
 
-@st.cache_data
 def load_data():
     """
     Load all reservation data from MySQL.
-    Uses @st.cache_data to load data only ONCE (improves performance).
+    Only called from the cached build_dashboard_tables, so it runs only ONCE.
     """
     engine = get_database_connection()
     
@@ -68,11 +70,340 @@ def load_data():
     
     df = pd.read_sql(query, engine)
 
+    # Shared dtype map (category text columns, downcast counts/prices)
+    df = apply_column_dtypes(df)
+
     # Derived feature (business logic)
-    df['total_guests'] = df['no_of_adults'] + df['no_of_children']
+    # (largest possible sum must fit int8 before adding)
+    assert int(df['no_of_adults'].max()) + int(df['no_of_children'].max()) <= np.iinfo(np.int8).max, \
+        "total_guests would overflow int8"
+    # (numpy add on the int8 arrays: no index alignment, stays int8)
+    df['total_guests'] = df['no_of_adults'].to_numpy() + df['no_of_children'].to_numpy()
+    df['is_canceled'] = (df['booking_status'] == 'Canceled').astype(np.int8)
 
     return df
 
+# ================================================
+# AGGREGATIONS
+# (called from build_dashboard_tables, which caches the results)
+# ================================================
+
+def get_confirmed(df):
+    """
+    Return only confirmed (not canceled) bookings.
+    """
+    return df[df['booking_status'] == 'Not_Canceled']
+
+def compute_segment_revenue(df_confirmed):
+    """
+    Revenue, bookings and ADR by market segment (confirmed bookings only).
+    """
+    segment_revenue = df_confirmed.groupby('market_segment_type', observed=True, sort=False).agg(
+        revenue=('total_revenue', 'sum'),
+        bookings=('total_revenue', 'size'),
+        adr=('avg_price_per_room', 'mean')
+    ).reset_index()
+
+    # Rename columns for clarity
+    segment_revenue.columns = ['Segment', 'Total Revenue', 'Bookings', 'ADR']
+
+    # Sort by revenue
+    return segment_revenue.sort_values('Total Revenue', ascending=False)
+
+def compute_monthly_revenue(df_confirmed):
+    """
+    Revenue, bookings and ADR by arrival month (confirmed bookings only).
+    """
+    monthly_revenue = df_confirmed.groupby(['arrival_year', 'arrival_month'], sort=False).agg(
+        revenue=('total_revenue', 'sum'),
+        bookings=('total_revenue', 'size'),
+        adr=('avg_price_per_room', 'mean')
+    ).reset_index()
+
+    # Rename columns
+    monthly_revenue.columns =['Year', 'Month', 'Revenue', 'Bookings', 'ADR']
+
+    # Create year-month label for better visualization
+    # (numpy string ops: one C-level pass, no intermediate object columns)
+    year = monthly_revenue['Year'].to_numpy().astype(str)
+    month = np.char.zfill(monthly_revenue['Month'].to_numpy().astype(str), 2)
+    monthly_revenue['Period'] = np.char.add(np.char.add(year, '-'), month)
+
+    # Sort by period
+    return monthly_revenue.sort_values(['Year', 'Month'])
+
+def compute_cancel_analysis(df):
+    """
+    Cancellation rate, ADR and average lead time by booking window.
+    """
+    # Create lead time buckets (vectorized binning, no per-row Python calls)
+    lead_time_bins = [-np.inf, 7, 30, 90, 180, np.inf]
+    lead_time_labels = [
+        '1. Last Minute (0-6 days)',
+        '2. Short Notice (7-29 days)',
+        '3. Standard (30-89 days)',
+        '4. Early Booking (90-179 days)',
+        '5. Very Early (180+ days)'
+    ]
+    booking_window = pd.cut(df['lead_time'], bins=lead_time_bins, labels=lead_time_labels, right=False)
+
+    # Calculate cancellation rate by booking window
+    cancel_analysis = df.groupby(booking_window.rename('booking_window'), observed=True, sort=False).agg(
+        total=('is_canceled', 'size'),
+        canceled=('is_canceled', 'sum'),
+        adr=('avg_price_per_room', 'mean'),
+        lead=('lead_time', 'mean')
+    ).reset_index()
+
+    # Rename columns
+    cancel_analysis.columns = ['Booking Window', 'Total Bookings', 'Canceled', 'ADR', 'Avg Lead Time']
+
+    # Calculate cancellation rate percentage
+    cancel_analysis['Cancellation Rate (%)'] = cancel_analysis['Canceled'] / cancel_analysis['Total Bookings'] * 100
+
+    # Sort by booking window (ordered Categorical from pd.cut, so this sorts
+    # the 5 result rows by category code, not by label string)
+    return cancel_analysis.sort_values('Booking Window')
+
+def compute_room_analysis(df):
+    """
+    Volume, cancellations, revenue and ADR by reserved room type.
+    """
+    # Revenue and price counted for confirmed bookings only
+    # (NaN price so the ADR mean skips canceled bookings). Masked with
+    # np.where on the raw arrays, so no per-group lookups and no index alignment.
+    is_confirmed = (df['booking_status'] == 'Not_Canceled').to_numpy()
+    room_data = pd.DataFrame({
+        'room_type_reserved': df['room_type_reserved'],
+        'is_canceled': df['is_canceled'],
+        'rev_if_confirmed': np.where(is_confirmed, df['total_revenue'].to_numpy(), 0.0),
+        'price_if_confirmed': np.where(is_confirmed, df['avg_price_per_room'].to_numpy(), np.nan)
+    })
+
+    # One groupby pass, built-in aggregations only
+    room_analysis = room_data.groupby('room_type_reserved', observed=True, sort=False).agg(
+        total=('is_canceled', 'size'),
+        canceled=('is_canceled', 'sum'),
+        total_rev=('rev_if_confirmed', 'sum'),
+        adr=('price_if_confirmed', 'mean')
+    ).reset_index()
+
+    # Rename columns
+    room_analysis.columns = ['Room Type', 'Total Bookings', 'Canceled', 'Total Revenue', 'ADR']
+
+    # Calculate additional metrics
+    room_analysis['Confirmed'] = room_analysis['Total Bookings'] - room_analysis['Canceled']
+    room_analysis['Cancellation Rate (%)'] = room_analysis['Canceled'] / room_analysis['Total Bookings'] *100
+    room_analysis['Revenue per Booking'] = room_analysis['Total Revenue'] / room_analysis['Total Bookings']
+
+    # Sort by total revenue
+    return room_analysis.sort_values('Total Revenue', ascending=False)
+
+@st.cache_data
+def build_dashboard_tables():
+    """
+    Load the data and compute every table the dashboard renders.
+    Uses @st.cache_data so reruns (widget clicks, resizes) only draw
+    cached tables and never touch the full dataset.
+    """
+    df = load_data()
+
+    # Quick stats from one boolean mask (no filtered DataFrame per metric)
+    is_confirmed = (df['booking_status'] == 'Not_Canceled').to_numpy()
+    metrics = {
+        'total': len(df),
+        'confirmed': int(is_confirmed.sum()),
+        # (nanmean: a missing price is skipped, as pandas .mean() does)
+        'adr': np.nanmean(df['avg_price_per_room'].to_numpy()[is_confirmed], dtype=np.float64),
+        'revenue': df['total_revenue'].to_numpy()[is_confirmed].sum()
+    }
+
+    # Filter only confirmed bookings (shared by segment and monthly)
+    df_confirmed = get_confirmed(df)
+
+    return SimpleNamespace(
+        # (sample shown to users: without the internal is_canceled helper)
+        df_head=df.drop(columns='is_canceled').head(10),
+        metrics=metrics,
+        segment=compute_segment_revenue(df_confirmed),
+        monthly=compute_monthly_revenue(df_confirmed),
+        cancel=compute_cancel_analysis(df),
+        room=compute_room_analysis(df)
+    )
+
+# ================================================
+# CACHED FIGURES
+# ================================================
+
+# The section tables are unrounded (formatted only by column_config), so
+# every bar chart sets an explicit hovertemplate to format its values.
+
+# Color scales resolved once (same stops Plotly uses for 'Blues' / 'Reds')
+BLUES = px.colors.sequential.Blues
+REDS = px.colors.sequential.Reds
+
+@st.cache_data
+def build_segment_fig(segment_revenue):
+    """
+    Bar chart of total revenue by market segment.
+    """
+    # Create bar chart
+    fig1 = px.bar(
+        segment_revenue,
+        x='Segment',
+        y='Total Revenue',
+        title='Total Revenue by Market Segment',
+        labels={'Total Revenue': 'Revenue ($)', 'Segment': 'Market Segment'},
+        color='Total Revenue',
+        color_continuous_scale=BLUES,
+        text='Total Revenue'
+    )
+
+    # Update layout
+    fig1.update_traces(
+        texttemplate='$%{text:,.0f}',
+        textposition='outside',
+        hovertemplate='Market Segment=%{x}<br>Revenue ($)=%{y:,.2f}<extra></extra>'
+    )
+    fig1.update_layout(showlegend=False, height=500)
+
+    return fig1
+
+@st.cache_data
+def build_monthly_fig(monthly_revenue):
+    """
+    Line chart of the monthly revenue trend.
+    """
+    # Create line chart
+    fig2 = px.line(
+        monthly_revenue,
+        x='Period',
+        y='Revenue',
+        title='Monthly Revenue Trend',
+        labels={'Revenue': 'Revenue ($)', 'Period': 'Month'},
+        markers=True
+    )
+
+    # Update layout
+    fig2.update_traces(line_color='#1f77b4', line_width=3, marker=dict(size=8))
+    fig2.update_layout(height=500, hovermode='x unified')
+
+    return fig2
+
+@st.cache_data
+def build_cancel_fig(cancel_analysis):
+    """
+    Bar chart of cancellation rate by booking window.
+    """
+    # Create combined bar chart
+    fig3 = px.bar(
+        cancel_analysis,
+        x='Booking Window',
+        y='Cancellation Rate (%)',
+        title='Cancellation Rate by Booking Window',
+        labels={'Cancellation Rate (%)': 'Cancellation Rate (%)', 'Booking Window': 'Booking Window'},
+        color='Cancellation Rate (%)',
+        color_continuous_scale=REDS,
+        text='Cancellation Rate (%)'
+    )
+
+    # Update traces
+    fig3.update_traces(
+        texttemplate='%{text:.1f}%',
+        textposition='outside',
+        hovertemplate='Booking Window=%{x}<br>Cancellation Rate (%)=%{y:.1f}<extra></extra>'
+    )
+    fig3.update_layout(showlegend=False, height=500)
+
+    return fig3
+
+@st.cache_data
+def build_room_fig_a(room_analysis):
+    """
+    Bar chart of total revenue by room type.
+    """
+    fig4a = px.bar(
+        room_analysis,
+        x='Room Type',
+        y='Total Revenue',
+        title='Total Revenue by Room Type',
+        labels={'Total Revenue': 'Revenue ($)', 'Room Type': 'Room Type'},
+        color='Total Revenue',
+        color_continuous_scale=BLUES,
+        text='Total Revenue'
+    )
+
+    fig4a.update_traces(
+        texttemplate='$%{text:,.0f}',
+        textposition='outside',
+        hovertemplate='Room Type=%{x}<br>Revenue ($)=%{y:,.2f}<extra></extra>'
+    )
+    fig4a.update_layout(showlegend=False, height=450)
+
+    return fig4a
+
+@st.cache_data
+def build_room_fig_b(room_analysis):
+    """
+    Grouped bars of ADR (left axis) vs cancellation rate (right axis) by room type.
+    """
+    # Create figure (traces take plain numpy arrays, which Plotly
+    # serializes directly instead of converting each pandas Series)
+    fig4b = go.Figure()
+
+    # Add ADR bars (green)
+    fig4b.add_trace(go.Bar(
+        name='ADR ($)',
+        x=room_analysis['Room Type'].to_numpy(),
+        y=room_analysis['ADR'].to_numpy(),
+        yaxis='y',
+        marker_color='#2ca02c',
+        text=room_analysis['ADR'].to_numpy(),
+        texttemplate='$%{text:.0f}',
+        textposition='outside',
+        hovertemplate='Room Type=%{x}<br>ADR ($)=%{y:.2f}<extra></extra>',
+        offsetgroup=1  
+    ))
+
+    # Add Cancellation Rate bars (red)
+    fig4b.add_trace(go.Bar(
+        name='Cancellation Rate (%)',
+        x=room_analysis['Room Type'].to_numpy(),
+        y=room_analysis['Cancellation Rate (%)'].to_numpy(),
+        yaxis='y2',
+        marker_color='#d62728',
+        text=room_analysis['Cancellation Rate (%)'].to_numpy(),
+        texttemplate='%{text:.1f}%',
+        textposition='outside',
+        hovertemplate='Room Type=%{x}<br>Cancellation Rate (%)=%{y:.1f}<extra></extra>',
+        offsetgroup=2  
+    ))
+
+    # Update layout
+    fig4b.update_layout(
+        title='ADR vs Cancellation Rate by Room Type',
+        xaxis=dict(title='Room Type'),
+        yaxis=dict(
+            title='ADR ($)',
+            side='left',
+            showgrid=False,
+            range=[0, room_analysis['ADR'].max() * 1.2]  
+        ),
+        yaxis2=dict(
+            title='Cancellation Rate (%)',
+            side='right',
+            overlaying='y',
+            showgrid=False,
+            range=[0, room_analysis['Cancellation Rate (%)'].max() * 1.2]  
+        ),
+        barmode='group',
+        height=450,
+        legend=dict(x=0.01, y=0.99),
+        bargap=0.2  
+    )
+
+    return fig4b
+
 # ================================================
 # HEADER
 # ================================================
@@ -87,17 +418,23 @@ st.markdown("---")
 
 # Show loading message while data loads
 with st.spinner("Loading data from MySQL..."):
-    df = load_data()
+    T = build_dashboard_tables()
 
 # Show success message
-st.success(f"✅ Loaded {len(df):,} reservations from database!")
+st.success(f"✅ Loaded {T.metrics['total']:,} reservations from database!")
 
 # ================================================
 # SHOW SAMPLE DATA
 # ================================================
 
 st.subheader("📊 Sample Data")
-st.dataframe(df.head(10), use_container_width=True)
+st.dataframe(
+    T.df_head,
+    use_container_width=True,
+    column_config={
+        'avg_price_per_room': st.column_config.NumberColumn(format='%.2f')
+    }
+)
 
 # ================================================
 # BASIC STATISTICS
@@ -108,18 +445,18 @@ st.subheader("📈 Quick Stats")
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    st.metric("Total Bookings", f"{len(df):,}")
+    st.metric("Total Bookings", f"{T.metrics['total']:,}")
 
 with col2:
-    confirmed = len(df[df['booking_status'] == 'Not_Canceled'])
+    confirmed = T.metrics['confirmed']
     st.metric("Confirmed Bookings", f"{confirmed:,}")
 
 with col3:
-    avg_adr = df[df['booking_status'] == 'Not_Canceled']['avg_price_per_room'].mean()
+    avg_adr = T.metrics['adr']
     st.metric("Average ADR", f"${avg_adr:.2f}")
 
 with col4:
-    total_revenue = df[df['booking_status'] == 'Not_Canceled']['total_revenue'].sum()
+    total_revenue = T.metrics['revenue']
     st.metric("Total Revenue", f"${total_revenue:,.0f}")
 
     # ================================================
@@ -129,48 +466,26 @@ with col4:
 st.markdown("---")
 st.header("💰 Revenue by Market Segment")
 
-# Filter only confirmed bookings
-df_confirmed = df[df['booking_status'] == 'Not_Canceled'].copy()
-
-# Calculate revenue by segment
-segment_revenue = df_confirmed.groupby('market_segment_type').agg({
-    'total_revenue': 'sum',
-    'Booking_ID': 'count',
-    'avg_price_per_room': 'mean'
-}).reset_index()
-
-# Rename columns for clarity
-segment_revenue.columns = ['Segment', 'Total Revenue', 'Bookings', 'ADR']
-
-# Round values
-segment_revenue['Total Revenue'] = segment_revenue['Total Revenue'].round(2)
-segment_revenue['ADR'] = segment_revenue['ADR'].round(2)
-
-# Sort by revenue
-segment_revenue = segment_revenue.sort_values('Total Revenue', ascending=False)
+# Cached segment table
+segment_revenue = T.segment
 
 # Create bar chart
-fig1 = px.bar(
-    segment_revenue,
-    x='Segment',
-    y='Total Revenue',
-    title='Total Revenue by Market Segment',
-    labels={'Total Revenue': 'Revenue ($)', 'Segment': 'Market Segment'},
-    color='Total Revenue',
-    color_continuous_scale='Blues',
-    text='Total Revenue'
-)
-
-# Update layout
-fig1.update_traces(texttemplate='$%{text:,.0f}', textposition='outside')
-fig1.update_layout(showlegend=False, height=500)
+fig1 = build_segment_fig(segment_revenue)
 
 # Display chart
 st.plotly_chart(fig1, use_container_width=True)
 
 # Display data table below chart
 with st.expander("📊 View Detailed Data"):
-    st.dataframe(segment_revenue, use_container_width=True)
+    st.dataframe(
+        segment_revenue,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Total Revenue': st.column_config.NumberColumn(format='$%.2f'),
+            'ADR': st.column_config.NumberColumn(format='$%.2f')
+        }
+    )
 
 # ================================================
 # SECTION 2: MONTHLY REVENUE TREND
@@ -179,35 +494,11 @@ with st.expander("📊 View Detailed Data"):
 st.markdown("---")
 st.header("📈 Monthly Revenue Trend")
 
-# Group by year and month
-monthly_revenue = df_confirmed.groupby(['arrival_year', 'arrival_month']).agg({
-    'total_revenue': 'sum',
-    'Booking_ID': 'count',
-    'avg_price_per_room': 'mean'
-}).reset_index()
-
-# Rename columns
-monthly_revenue.columns =['Year', 'Month', 'Revenue', 'Bookings', 'ADR']
-
-# Create year-month label for better visualization
-monthly_revenue['Period'] = monthly_revenue['Year'].astype(str) + '-' + monthly_revenue['Month'].astype(str).str.zfill(2)
-
-# Sort by period
-monthly_revenue = monthly_revenue.sort_values(['Year', 'Month'])
+# Cached monthly table
+monthly_revenue = T.monthly
 
 # Create line chart
-fig2 = px.line(
-    monthly_revenue,
-    x='Period',
-    y='Revenue',
-    title='Monthly Revenue Trend',
-    labels={'Revenue': 'Revenue ($)', 'Period': 'Month'},
-    markers=True
-)
-
-# Update layout
-fig2.update_traces(line_color='#1f77b4', line_width=3, marker=dict(size=8))
-fig2.update_layout(height=500, hovermode='x unified')
+fig2 = build_monthly_fig(monthly_revenue)
 
 # Display chart
 st.plotly_chart(fig2, use_container_width=True)
@@ -215,8 +506,11 @@ st.plotly_chart(fig2, use_container_width=True)
 # Show key insights
 col1, col2, col3 = st.columns(3)
 
+# Positional lookup of best/worst month (numpy argmax/argmin, no label index)
+monthly_rev = monthly_revenue['Revenue'].to_numpy()
+
 with col1:
-    peak_month = monthly_revenue.loc[monthly_revenue['Revenue'].idxmax()]
+    peak_month = monthly_revenue.iloc[monthly_rev.argmax()]
     st.metric(
         "Peak Revenue Month",
         f"{peak_month['Period']}",
@@ -224,7 +518,7 @@ with col1:
     )
 
 with col2:
-    lowest_month = monthly_revenue.loc[monthly_revenue['Revenue'].idxmin()]
+    lowest_month = monthly_revenue.iloc[monthly_rev.argmin()]
     st.metric(
         "Lowest Revenue Month",
         f"{lowest_month['Period']}",
@@ -232,7 +526,7 @@ with col2:
     )
 
 with col3:
-    avg_monthly = monthly_revenue['Revenue'].mean()
+    avg_monthly = monthly_rev.mean()
     st.metric(
         "Average Monthly Revenue",
         f"${avg_monthly:.0f}"
@@ -240,7 +534,15 @@ with col3:
 
 # Show data table
 with st.expander("📊 View Monthly Data"):
-    st.dataframe(monthly_revenue[['Period','Revenue', 'Bookings', 'ADR']], use_container_width=True)
+    st.dataframe(
+        monthly_revenue[['Period','Revenue', 'Bookings', 'ADR']],
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'Revenue': st.column_config.NumberColumn(format='$%.2f'),
+            'ADR': st.column_config.NumberColumn(format='$%.2f')
+        }
+    )
 
 # ================================================
 # SECTION 3: CANCELLATION ANALYSIS BY LEAD TIME
@@ -249,54 +551,11 @@ with st.expander("📊 View Monthly Data"):
 st.markdown("---")
 st.header("⚠️ Cancellation Analysis by Lead Time")
 
-# Create lead time buckets
-def categorize_lead_time(days):
-    if days < 7:
-        return '1. Last Minute (0-6 days)'
-    elif days < 30:
-        return '2. Short Notice (7-29 days)'
-    elif days < 90:
-        return '3. Standard (30-89 days)'
-    elif days < 180:
-        return '4. Early Booking (90-179 days)'
-    else:
-        return '5. Very Early (180+ days)'
-
-# Apply categorization
-df['booking_window'] = df['lead_time'].apply(categorize_lead_time)
-
-# Calculate cancellation rate by booking window
-cancel_analysis = df.groupby('booking_window').agg({
-    'Booking_ID': 'count',
-    'booking_status': lambda x: (x == 'Canceled').sum(),
-    'avg_price_per_room': 'mean',
-    'lead_time': 'mean'
-}).reset_index()
-
-# Rename columns
-cancel_analysis.columns = ['Booking Window', 'Total Bookings', 'Canceled', 'ADR', 'Avg Lead Time']
-
-# Calculate cancellation rate percentage
-cancel_analysis['Cancellation Rate (%)'] = (cancel_analysis['Canceled'] / cancel_analysis['Total Bookings'] * 100).round(1)
-
-# Sort by booking window
-cancel_analysis = cancel_analysis.sort_values('Booking Window')
+# Cached booking window table
+cancel_analysis = T.cancel
 
 # Create combined bar chart
-fig3 = px.bar(
-    cancel_analysis,
-    x='Booking Window',
-    y='Cancellation Rate (%)',
-    title='Cancellation Rate by Booking Window',
-    labels={'Cancellation Rate (%)': 'Cancellation Rate (%)', 'Booking Window': 'Booking Window'},
-    color='Cancellation Rate (%)',
-    color_continuous_scale='Reds',
-    text='Cancellation Rate (%)'
-)
-
-# Update traces
-fig3.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-fig3.update_layout(showlegend=False, height=500)
+fig3 = build_cancel_fig(cancel_analysis)
 
 # Display chart
 st.plotly_chart(fig3, use_container_width=True)
@@ -330,7 +589,16 @@ with col2:
 
 # Show data table
 with st.expander("📊 View Detailed Cancellation Data"):
-    st.dataframe(cancel_analysis, use_container_width=True)
+    st.dataframe(
+        cancel_analysis,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'ADR': st.column_config.NumberColumn(format='$%.2f'),
+            'Avg Lead Time': st.column_config.NumberColumn(format='%.1f days'),
+            'Cancellation Rate (%)': st.column_config.NumberColumn(format='%.1f%%')
+        }
+    )
 
 # ================================================
 # SECTION 4: ROOM TYPE PERFORMANCE
@@ -339,29 +607,8 @@ with st.expander("📊 View Detailed Cancellation Data"):
 st.markdown("---")
 st.header("🏨 Room Type Performance Analysis")
 
-# Calculate metrics by room type
-room_analysis = df.groupby('room_type_reserved').agg({
-    'Booking_ID': 'count',
-    'booking_status': lambda x:(x == 'Canceled').sum(),
-    'total_revenue': lambda x: x[df.loc[x.index, 'booking_status'] == 'Not_Canceled'].sum(),
-    'avg_price_per_room': lambda x: x[df.loc[x.index, 'booking_status'] == 'Not_Canceled'].mean()
-}).reset_index()
-
-# Rename columns
-room_analysis.columns = ['Room Type', 'Total Bookings', 'Canceled', 'Total Revenue', 'ADR']
-
-# Calculate additional metrics
-room_analysis['Confirmed'] = room_analysis['Total Bookings'] - room_analysis['Canceled']
-room_analysis['Cancellation Rate (%)'] = (room_analysis['Canceled'] / room_analysis['Total Bookings'] *100).round(1)
-room_analysis['Revenue per Booking'] = (room_analysis['Total Revenue'] / room_analysis['Total Bookings']).round(2)
-
-
-# Round values
-room_analysis['Total Revenue'] = room_analysis['Total Revenue'].round(2)
-room_analysis['ADR'] = room_analysis['ADR'].round(2)
-
-# Sort by total revenue
-room_analysis = room_analysis.sort_values('Total Revenue', ascending=False)
+# Cached room type table
+room_analysis = T.room
 
 # Create two columns for side-by-side charts
 col1, col2 = st.columns(2)
@@ -371,20 +618,7 @@ col1, col2 = st.columns(2)
 # ================================================
 
 with col1:
-    fig4a = px.bar(
-        room_analysis,
-        x='Room Type',
-        y='Total Revenue',
-        title='Total Revenue by Room Type',
-        labels={'Total Revenue': 'Revenue ($)', 'Room Type': 'Room Type'},
-        color='Total Revenue',
-        color_continuous_scale='Blues',
-        text='Total Revenue'
-    )
-    
-    fig4a.update_traces(texttemplate='$%{text:,.0f}', textposition='outside')
-    fig4a.update_layout(showlegend=False, height=450)
-    
+    fig4a = build_room_fig_a(room_analysis)
     st.plotly_chart(fig4a, use_container_width=True)
 
 # ================================================
@@ -392,58 +626,7 @@ with col1:
 # ================================================
 
 with col2:
-    # Create figure
-    fig4b = go.Figure()
-    
-    # Add ADR bars (green)
-    fig4b.add_trace(go.Bar(
-        name='ADR ($)',
-        x=room_analysis['Room Type'],
-        y=room_analysis['ADR'],
-        yaxis='y',
-        marker_color='#2ca02c',
-        text=room_analysis['ADR'],
-        texttemplate='$%{text:.0f}',
-        textposition='outside',
-        offsetgroup=1  
-    ))
-    
-    # Add Cancellation Rate bars (red)
-    fig4b.add_trace(go.Bar(
-        name='Cancellation Rate (%)',
-        x=room_analysis['Room Type'],
-        y=room_analysis['Cancellation Rate (%)'],
-        yaxis='y2',
-        marker_color='#d62728',
-        text=room_analysis['Cancellation Rate (%)'],
-        texttemplate='%{text:.1f}%',
-        textposition='outside',
-        offsetgroup=2  
-    ))
-    
-    # Update layout
-    fig4b.update_layout(
-        title='ADR vs Cancellation Rate by Room Type',
-        xaxis=dict(title='Room Type'),
-        yaxis=dict(
-            title='ADR ($)',
-            side='left',
-            showgrid=False,
-            range=[0, room_analysis['ADR'].max() * 1.2]  
-        ),
-        yaxis2=dict(
-            title='Cancellation Rate (%)',
-            side='right',
-            overlaying='y',
-            showgrid=False,
-            range=[0, room_analysis['Cancellation Rate (%)'].max() * 1.2]  
-        ),
-        barmode='group',
-        height=450,
-        legend=dict(x=0.01, y=0.99),
-        bargap=0.2  
-    )
-    
+    fig4b = build_room_fig_b(room_analysis)
     st.plotly_chart(fig4b, use_container_width=True)
 
 # Show strategic recommendations
@@ -490,4 +673,14 @@ with col3:
 st.subheader("📊 Detailed Room Type Metrics")
 display_cols = ['Room Type', 'Total Bookings', 'Confirmed', 'Canceled', 'Cancellation Rate (%)', 
                 'ADR', 'Total Revenue', 'Revenue per Booking']
-st.dataframe(room_analysis[display_cols], use_container_width=True)
\ No newline at end of file
+st.dataframe(
+    room_analysis[display_cols],
+    use_container_width=True,
+    hide_index=True,
+    column_config={
+        'Cancellation Rate (%)': st.column_config.NumberColumn(format='%.1f%%'),
+        'ADR': st.column_config.NumberColumn(format='$%.2f'),
+        'Total Revenue': st.column_config.NumberColumn(format='$%.2f'),
+        'Revenue per Booking': st.column_config.NumberColumn(format='$%.2f')
+    }
+)